@@ -0,0 +1,30 @@
+"""Packaging for the Chuck Norris CLI.
+
+The package installs as plain Python by default. Set CHUCK_MYPYC=1 (which
+requires mypy in the build environment) to compile src/main.py and
+src/models.py to C extensions with mypyc. src/api.py is I/O-bound and
+always stays pure Python.
+"""
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("CHUCK_MYPYC") == "1":
+	try:
+		from mypyc.build import mypycify
+	except ImportError:
+		raise SystemExit("CHUCK_MYPYC=1 requires mypy in the build environment")
+	ext_modules = mypycify(["src/main.py", "src/models.py"])
+
+setup(
+	name="chuck-norris-cli",
+	version="0.3.0",
+	description="Chuck Norris jokes CLI",
+	packages=["src"],
+	python_requires=">=3.10",
+	install_requires=["requests>=2.28.0", "aiohttp>=3.8.0", "aiolimiter>=1.1.0"],
+	extras_require={"fast": ["orjson>=3.8.0"], "cache": ["requests-cache>=1.0.0"]},
+	entry_points={"console_scripts": ["chuck=src.main:main"]},
+	ext_modules=ext_modules,
+)
@@ -1,10 +1,17 @@
 """Top-level package for the Chuck Norris CLI.
 
 Expose commonly used modules for convenience imports like `from src import api`.
+Submodules are loaded lazily (PEP 562) so importing the package stays cheap.
 """
 from __future__ import annotations
 
-from . import api  # re-exported for convenience
-from . import models
+import importlib
+from types import ModuleType
 
 __all__ = ["api", "models"]
+
+
+def __getattr__(name: str) -> ModuleType:
+	if name in __all__:
+		return importlib.import_module(f".{name}", __name__)
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,16 +3,176 @@
 These functions wrap the chucknorris.io endpoints. They are small and
 easy to mock in tests. Keep logic simple: fetch JSON and raise on
 HTTP/network errors so the CLI can handle user-friendly messages.
+
+`requests` is imported lazily, on the first real HTTP call, so CLI
+start-up does not pay for it.
 """
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+	import requests
 
-import requests
+try:
+	import orjson
+except ImportError:  # optional speedup; fall back to the stdlib
+	orjson = None  # type: ignore[assignment]
 
 BASE_URL = os.environ.get("CHUCK_API_BASE_URL", "https://api.chucknorris.io")
 DEFAULT_TIMEOUT = int(os.environ.get("CHUCK_CLI_TIMEOUT", "10"))
+# On-disk HTTP cache shared across CLI runs (needs requests-cache); "" disables it
+CACHE_PATH = os.environ.get("CHUCK_CLI_CACHE", os.path.expanduser("~/.cache/chuck-cli"))
+DISK_CACHE_TTL = 600
+
+# In-process caches. Random jokes are never cached.
+CATEGORIES_TTL = 600.0
+SEARCH_TTL = 60.0
+SEARCH_CACHE_SIZE = 128
+# Back off once fewer than this many requests remain in the rate-limit window
+RATELIMIT_FLOOR = 2
+MAX_RATELIMIT_WAIT = 60.0
+_CATS_CACHE: Dict[str, Any] = {"at": 0.0, "value": None}
+_SEARCH_CACHE: OrderedDict[Tuple[str, int], Tuple[float, Dict[str, Any]]] = OrderedDict()
+
+
+def _new_session() -> requests.Session:
+	"""Return a disk-cached Session when requests-cache is installed.
+
+	Categories and searches are then served from a SQLite cache across
+	CLI invocations for DISK_CACHE_TTL seconds; random jokes never are.
+	Falls back to an uncached Session if the cache cannot be opened.
+	"""
+	import sqlite3
+
+	import requests
+
+	if not CACHE_PATH:
+		return requests.Session()
+	try:
+		import requests_cache
+	except ImportError:
+		return requests.Session()
+	try:
+		return requests_cache.CachedSession(
+			CACHE_PATH,
+			backend="sqlite",
+			expire_after=DISK_CACHE_TTL,
+			allowable_methods=("GET",),
+			urls_expire_after={"*/jokes/random": requests_cache.DO_NOT_CACHE},
+		)
+	except (OSError, sqlite3.Error):  # e.g. read-only or sandboxed $HOME
+		return requests.Session()
+
+
+def _build_session() -> requests.Session:
+	"""Create a Session with a pooled, retrying adapter for the API host.
+
+	Reusing one Session keeps HTTP connections alive between calls so
+	commands that hit the API more than once skip the TCP/TLS handshake.
+	"""
+	from requests.adapters import HTTPAdapter
+	from urllib3.util.retry import Retry
+
+	session = _new_session()
+	# 429s are handled by _request so rate-limit headers are honoured in one place
+	retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+	adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+	session.mount("https://", adapter)
+	return session
+
+
+_SESSION: requests.Session | None = None
+
+
+def _get_session() -> requests.Session:
+	"""Return the shared Session, creating it on first use."""
+	global _SESSION
+	if _SESSION is None:
+		_SESSION = _build_session()
+	return _SESSION
+
+
+def close_session() -> None:
+	"""Close the shared Session; the next call opens a fresh one."""
+	global _SESSION
+	if _SESSION is not None:
+		_SESSION.close()
+		_SESSION = None
+
+
+def clear_cache() -> None:
+	"""Drop cached categories and search results."""
+	_CATS_CACHE["at"] = 0.0
+	_CATS_CACHE["value"] = None
+	_SEARCH_CACHE.clear()
+
+
+def _header_float(resp: requests.Response, name: str) -> float | None:
+	"""Return a numeric response header, or None when missing/invalid."""
+	value = resp.headers.get(name)
+	if value is None:
+		return None
+	try:
+		return float(value)
+	except ValueError:
+		return None
+
+
+def _check_ratelimit(resp: requests.Response) -> None:
+	"""Pause when the X-RateLimit-* headers say the window is nearly used up."""
+	remaining = _header_float(resp, "X-RateLimit-Remaining")
+	if remaining is None:
+		return
+	limit = _header_float(resp, "X-RateLimit-Limit") or 0.0
+	if remaining > max(RATELIMIT_FLOOR, limit * 0.1):
+		return
+
+	reset = _header_float(resp, "X-RateLimit-Reset") or _header_float(resp, "Retry-After") or 0.0
+	# Reset may be an epoch timestamp or a number of seconds
+	delay = reset - time.time() if reset > 1e9 else reset
+	if delay > 0:
+		time.sleep(min(delay, MAX_RATELIMIT_WAIT))
+
+
+def _raise_for_status(resp: requests.Response) -> None:
+	"""Like resp.raise_for_status(), but closes the response before raising.
+
+	This releases streamed (stream=True) connections back to the pool.
+	"""
+	try:
+		resp.raise_for_status()
+	except Exception:
+		resp.close()
+		raise
+
+
+def _request(method: str, url: str, **kwargs: Any) -> requests.Response:
+	"""Send a request through the shared Session, honouring rate limits.
+
+	A 429 response is retried once after waiting for Retry-After seconds.
+	Raises `requests.HTTPError` for any other error status.
+	"""
+	import requests
+
+	session = _get_session()
+	kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+	resp = session.request(method, url, **kwargs)
+	try:
+		_raise_for_status(resp)
+	except requests.exceptions.HTTPError:
+		if resp.status_code != 429:
+			raise
+		wait = _header_float(resp, "Retry-After") or 1.0
+		time.sleep(min(wait, MAX_RATELIMIT_WAIT))
+		resp = session.request(method, url, **kwargs)
+		_raise_for_status(resp)
+	if not getattr(resp, "from_cache", False):  # cached headers are stale
+		_check_ratelimit(resp)
+	return resp
 
 
 class APIError(Exception):
@@ -29,6 +189,34 @@ class APIError(Exception):
 		self.original = original
 
 
+def _read_body(resp: requests.Response) -> bytes:
+	"""Read a streamed (stream=True) response body in one go.
+
+	This skips requests' chunked iter_content/join so a large search
+	payload is buffered only once, and releases the connection after.
+	"""
+	try:
+		return resp.raw.read(decode_content=True)
+	finally:
+		resp.close()
+
+
+def _decode(body: bytes) -> Any:
+	"""Parse a response body as JSON, using orjson when it is installed.
+
+	Raises:
+		APIError: if the body is not valid JSON.
+	"""
+	try:
+		if orjson is not None:
+			return orjson.loads(body)
+		import json
+
+		return json.loads(body)
+	except ValueError as exc:  # orjson.JSONDecodeError subclasses ValueError
+		raise APIError("Invalid JSON received from API", exc)
+
+
 def get_random_joke(category: str | None = None, timeout: int | None = None) -> Dict[str, Any]:
 	"""Fetch a random joke from the API.
 
@@ -40,45 +228,71 @@ def get_random_joke(category: str | None = None, timeout: int | None = None) ->
 	Raises:
 		APIError: on network/HTTP/JSON/validation errors.
 	"""
+	import requests
+
 	url = f"{BASE_URL}/jokes/random"
 	params = {"category": category} if category else {}
 	try:
-		resp = requests.get(url, params=params, timeout=timeout or DEFAULT_TIMEOUT)
-		resp.raise_for_status()
+		resp = _request("GET", url, params=params, timeout=timeout or DEFAULT_TIMEOUT)
 	except requests.exceptions.Timeout as exc:
 		raise APIError("Request timed out while fetching random joke", exc)
 	except requests.exceptions.RequestException as exc:
 		raise APIError(f"Network error while fetching random joke: {exc}", exc)
 
-	# Parse JSON
-	try:
-		data = resp.json()
-	except ValueError as exc:  # includes simplejson.errors.JSONDecodeError
-		raise APIError("Invalid JSON received from API", exc)
+	data = _decode(resp.content)
 
 	# Basic validation: the API should return a dict with a 'value' key
-	if not isinstance(data, dict) or "value" not in data:
-		raise APIError("API returned unexpected response shape")
+	try:
+		data["value"]
+	except (TypeError, KeyError) as exc:
+		raise APIError("API returned unexpected response shape", exc)
 
 	return data
 
 
 def get_categories(timeout: int | None = None) -> List[str]:
-	"""Return the list of joke categories."""
+	"""Return the list of joke categories (cached for CATEGORIES_TTL seconds)."""
+	cached = _CATS_CACHE["value"]
+	if cached is not None and time.monotonic() - _CATS_CACHE["at"] < CATEGORIES_TTL:
+		return list(cached)
+
 	url = f"{BASE_URL}/jokes/categories"
-	resp = requests.get(url, timeout=timeout or DEFAULT_TIMEOUT)
-	resp.raise_for_status()
-	return resp.json()
+	resp = _request("GET", url, timeout=timeout or DEFAULT_TIMEOUT)
+	cats = _decode(resp.content)
+	_CATS_CACHE["at"] = time.monotonic()
+	_CATS_CACHE["value"] = cats
+	return list(cats)
+
+
+def _copy_results(data: Any) -> Any:
+	"""Shallow-copy a search response so callers cannot mutate the cache."""
+	if isinstance(data, dict) and isinstance(data.get("result"), list):
+		return {**data, "result": list(data["result"])}
+	return data
 
 
 def search_jokes(query: str, limit: int = 10, timeout: int | None = None) -> Dict[str, Any]:
-	"""Search jokes by query. Returns the parsed JSON (with keys like 'total' and 'result')."""
+	"""Search jokes by query. Returns the parsed JSON (with keys like 'total' and 'result').
+
+	Results are cached per (query, limit) for SEARCH_TTL seconds, keeping
+	at most SEARCH_CACHE_SIZE entries.
+	"""
+	key = (query, limit)
+	hit = _SEARCH_CACHE.get(key)
+	if hit is not None and time.monotonic() - hit[0] < SEARCH_TTL:
+		_SEARCH_CACHE.move_to_end(key)
+		return _copy_results(hit[1])
+
 	url = f"{BASE_URL}/jokes/search"
 	params = {"query": query}
-	resp = requests.get(url, params=params, timeout=timeout or DEFAULT_TIMEOUT)
-	resp.raise_for_status()
-	data = resp.json()
+	resp = _request("GET", url, params=params, timeout=timeout or DEFAULT_TIMEOUT, stream=True)
+	data = _decode(_read_body(resp))
 	# The API returns 'result' which can be larger than limit; trim client-side
 	if isinstance(data, dict) and "result" in data and isinstance(data["result"], list):
 		data["result"] = data["result"][:limit]
-	return data
+
+	_SEARCH_CACHE[key] = (time.monotonic(), data)
+	_SEARCH_CACHE.move_to_end(key)
+	if len(_SEARCH_CACHE) > SEARCH_CACHE_SIZE:
+		_SEARCH_CACHE.popitem(last=False)
+	return _copy_results(data)
@@ -0,0 +1,153 @@
+"""Async API helpers for fetching several jokes concurrently.
+
+The synchronous helpers in `src.api` serialize every round trip. These
+coroutines share one aiohttp session so that, for example, a random
+joke from every category can be fetched in roughly a single round trip.
+Errors are wrapped in the same `APIError` the sync helpers raise.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, TypeVar
+
+import aiohttp
+from aiolimiter import AsyncLimiter
+
+from src.api import BASE_URL, DEFAULT_TIMEOUT, APIError
+
+# Seconds to reuse a resolved address for api.chucknorris.io within a session
+DNS_CACHE_TTL = 300
+# Client-side caps for bulk fetches, to stay clear of server-side throttling.
+# Concurrency adapts between 1 and MAX_CONCURRENCY (see AdaptiveLimit).
+INITIAL_CONCURRENCY = 4
+MAX_CONCURRENCY = 32
+MAX_RATE = 30
+RATE_PERIOD = 60.0
+TARGET_LATENCY = 0.5
+
+T = TypeVar("T")
+
+
+class AdaptiveLimit:
+	"""Concurrency cap tuned with AIMD (additive increase, multiplicative decrease).
+
+	While the average latency of the last `window` requests stays at or
+	below `target_latency` the cap grows by `alpha`; a slower average or a
+	failed request (429, 5xx, reset, ...) multiplies it by `beta`.
+	Must be created and used inside a single running event loop.
+	"""
+
+	def __init__(
+		self,
+		initial: float = INITIAL_CONCURRENCY,
+		maximum: float = MAX_CONCURRENCY,
+		alpha: float = 0.5,
+		beta: float = 0.5,
+		target_latency: float = TARGET_LATENCY,
+		window: int = 20,
+	) -> None:
+		self.maximum = maximum
+		self.limit = min(initial, maximum)
+		self.alpha = alpha
+		self.beta = beta
+		self.target_latency = target_latency
+		self._latencies: Deque[float] = deque(maxlen=window)
+		self._in_flight = 0
+		self._cond = asyncio.Condition()
+
+	def _decrease(self) -> None:
+		self.limit = max(1.0, self.limit * self.beta)
+
+	def _observe(self, latency: float) -> None:
+		self._latencies.append(latency)
+		if sum(self._latencies) / len(self._latencies) <= self.target_latency:
+			self.limit = min(self.maximum, self.limit + self.alpha)
+		else:
+			self._decrease()
+
+	async def call(self, func: Callable[..., Awaitable[T]], *args: Any) -> T:
+		"""Await `func(*args)` once a slot is free, then adjust the cap."""
+		async with self._cond:
+			await self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+			self._in_flight += 1
+		start = time.monotonic()
+		try:
+			result = await func(*args)
+		except Exception:
+			self._decrease()
+			raise
+		else:
+			self._observe(time.monotonic() - start)
+		finally:
+			async with self._cond:
+				self._in_flight -= 1
+				self._cond.notify_all()
+		return result
+
+
+def make_session(timeout: int | None = None) -> aiohttp.ClientSession:
+	"""Create a ClientSession with a pooled connector for the API host."""
+	connector = aiohttp.TCPConnector(
+		limit=64, limit_per_host=MAX_CONCURRENCY, use_dns_cache=True, ttl_dns_cache=DNS_CACHE_TTL
+	)
+	client_timeout = aiohttp.ClientTimeout(total=timeout or DEFAULT_TIMEOUT)
+	return aiohttp.ClientSession(connector=connector, timeout=client_timeout)
+
+
+async def _get_json(session: aiohttp.ClientSession, url: str, params: Dict[str, str] | None = None) -> Any:
+	"""GET `url` and return the parsed JSON body.
+
+	Raises:
+		APIError: on timeout, network/HTTP errors or invalid JSON.
+	"""
+	try:
+		async with session.get(url, params=params or {}) as resp:
+			resp.raise_for_status()
+			return await resp.json()
+	except asyncio.TimeoutError as exc:
+		raise APIError(f"Request timed out while fetching {url}", exc)
+	except aiohttp.ClientError as exc:
+		raise APIError(f"Network error while fetching {url}: {exc}", exc)
+	except ValueError as exc:
+		raise APIError("Invalid JSON received from API", exc)
+
+
+async def get_random_joke_async(session: aiohttp.ClientSession, category: str | None = None) -> Dict[str, Any]:
+	"""Async counterpart of `api.get_random_joke`."""
+	params = {"category": category} if category else {}
+	data = await _get_json(session, f"{BASE_URL}/jokes/random", params)
+	# Basic validation: the API should return a dict with a 'value' key
+	try:
+		data["value"]
+	except (TypeError, KeyError) as exc:
+		raise APIError("API returned unexpected response shape", exc)
+	return data
+
+
+async def search_jokes_async(session: aiohttp.ClientSession, query: str, limit: int = 10) -> Dict[str, Any]:
+	"""Async counterpart of `api.search_jokes`."""
+	data = await _get_json(session, f"{BASE_URL}/jokes/search", {"query": query})
+	if isinstance(data, dict) and "result" in data and isinstance(data["result"], list):
+		data["result"] = data["result"][:limit]
+	return data
+
+
+async def bulk_random(categories: List[str], timeout: int | None = None) -> List[Dict[str, Any]]:
+	"""Fetch one random joke per category concurrently, preserving order.
+
+	In-flight requests are capped by an AdaptiveLimit and at most MAX_RATE
+	start per RATE_PERIOD seconds. Both are created per call because
+	asyncio primitives bind to the running event loop.
+	"""
+	limiter = AsyncLimiter(MAX_RATE, RATE_PERIOD)
+	adaptive = AdaptiveLimit(INITIAL_CONCURRENCY, MAX_CONCURRENCY)
+
+	async def fetch(category: str) -> Dict[str, Any]:
+		# each request acquires the limiter individually
+		async with limiter:
+			return await adaptive.call(get_random_joke_async, session, category)
+
+	async with make_session(timeout) as session:
+		return list(await asyncio.gather(*[fetch(c) for c in categories]))
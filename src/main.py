@@ -1,7 +1,7 @@
 """Command-line entrypoint for the Chuck Norris jokes CLI.
 
 Provides three subcommands:
- - random [--category CATEGORY]
+ - random [--category CATEGORY | --all-categories]
  - categories
  - search QUERY [--limit N]
 
@@ -10,20 +10,47 @@ Supports --verbose and --json global flags.
 from __future__ import annotations
 
 import argparse
-import json
 import sys
-from typing import Any
+from typing import Any, Callable
 
 from src import api
 
+try:
+	import orjson
+except ImportError:  # optional speedup; fall back to the stdlib
+	orjson = None  # type: ignore[assignment]
+
+
+def _dumps(obj: Any) -> str:
+	"""Serialize `obj` as indented JSON, using orjson when it is installed."""
+	if orjson is not None:
+		return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+	import json
+
+	return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def _write_json(obj: Any) -> None:
+	"""Write `obj` to stdout as indented JSON.
+
+	With orjson the encoded bytes go straight to sys.stdout.buffer,
+	skipping the str decode and the text layer's re-encode.
+	"""
+	buffer = getattr(sys.stdout, "buffer", None)
+	if orjson is None or buffer is None:
+		print(_dumps(obj))
+		return
+	sys.stdout.flush()  # keep ordering with any text already written
+	buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+
 
 def print_joke(j: dict[str, Any], verbose: bool = False, as_json: bool = False) -> None:
 	if as_json:
-		print(json.dumps(j, ensure_ascii=False, indent=2))
+		_write_json(j)
 		return
 
 	if verbose:
-		parts = [f"ID: {j.get('id')}", f"URL: {j.get('url')}"]
+		parts: list[str] = [f"ID: {j.get('id')}", f"URL: {j.get('url')}"]
 		cats = j.get("categories")
 		if cats:
 			parts.append(f"Categories: {', '.join(cats)}")
@@ -34,6 +61,9 @@ def print_joke(j: dict[str, Any], verbose: bool = False, as_json: bool = False)
 
 
 def handle_random(args: argparse.Namespace) -> int:
+	if args.all_categories:
+		return handle_random_all(args)
+
 	try:
 		joke = api.get_random_joke(category=args.category)
 	except Exception as e:  # requests exceptions or others
@@ -44,6 +74,29 @@ def handle_random(args: argparse.Namespace) -> int:
 	return 0
 
 
+def handle_random_all(args: argparse.Namespace) -> int:
+	# imported lazily so aiohttp/asyncio are only loaded for this command
+	import asyncio
+
+	from src import api_async
+
+	try:
+		cats = api.get_categories()
+		jokes = asyncio.run(api_async.bulk_random(cats))
+	except Exception as e:
+		print(f"Error: failed to fetch random jokes - {e}", file=sys.stderr)
+		return 2
+
+	if args.json:
+		_write_json(jokes)
+		return 0
+
+	for cat, joke in zip(cats, jokes):
+		print(f"[{cat}]")
+		print_joke(joke, verbose=args.verbose)
+	return 0
+
+
 def handle_categories(args: argparse.Namespace) -> int:
 	try:
 		cats = api.get_categories()
@@ -52,10 +105,9 @@ def handle_categories(args: argparse.Namespace) -> int:
 		return 2
 
 	if args.json:
-		print(json.dumps(cats, ensure_ascii=False, indent=2))
-	else:
-		for c in cats:
-			print(c)
+		_write_json(cats)
+	elif cats:
+		sys.stdout.write("\n".join(cats) + "\n")
 	return 0
 
 
@@ -71,22 +123,26 @@ def handle_search(args: argparse.Namespace) -> int:
 		print(f"Error: failed to search jokes - {e}", file=sys.stderr)
 		return 2
 
-	results = data.get("result") if isinstance(data, dict) else None
+	results: list[dict[str, Any]] | None = data.get("result") if isinstance(data, dict) else None
 	if args.json:
-		print(json.dumps(data, ensure_ascii=False, indent=2))
+		_write_json(data)
 		return 0
 
 	if not results:
 		print("No jokes found.")
 		return 0
 
+	# Build the whole listing and write it once instead of print() per line
+	lines: list[str] = []
+	verbose = args.verbose
 	for idx, item in enumerate(results, start=1):
-		print(f"{idx}. {item.get('value')}")
-		if args.verbose:
-			print(f"   id: {item.get('id')}")
+		lines.append(f"{idx}. {item.get('value')}")
+		if verbose:
+			lines.append(f"   id: {item.get('id')}")
 			cats = item.get("categories")
 			if cats:
-				print(f"   categories: {', '.join(cats)}")
+				lines.append(f"   categories: {', '.join(cats)}")
+	sys.stdout.write("\n".join(lines) + "\n")
 	return 0
 
 
@@ -98,7 +154,11 @@ def build_parser() -> argparse.ArgumentParser:
 	sub = parser.add_subparsers(dest="command", required=True)
 
 	p_random = sub.add_parser("random", help="Get a single random joke")
-	p_random.add_argument("--category", "-c", help="Category to fetch a random joke from")
+	random_src = p_random.add_mutually_exclusive_group()
+	random_src.add_argument("--category", "-c", help="Category to fetch a random joke from")
+	random_src.add_argument(
+		"--all-categories", action="store_true", help="Fetch one random joke from every category"
+	)
 	p_random.set_defaults(func=handle_random)
 
 	p_cats = sub.add_parser("categories", help="List available joke categories")
@@ -112,13 +172,25 @@ def build_parser() -> argparse.ArgumentParser:
 	return parser
 
 
+_PARSER: argparse.ArgumentParser | None = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+	"""Return the CLI parser, building it once per process."""
+	global _PARSER
+	if _PARSER is None:
+		_PARSER = build_parser()
+	return _PARSER
+
+
 def main(argv: list[str] | None = None) -> int:
-	parser = build_parser()
+	parser = _get_parser()
 	args = parser.parse_args(argv)
 
 	# pass verbose/json flags to handlers via args
 	try:
-		return args.func(args)
+		handler: Callable[[argparse.Namespace], int] = args.func
+		return handler(args)
 	except AttributeError:
 		parser.print_help()
 		return 1
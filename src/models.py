@@ -1,41 +1,37 @@
 """Data models for the Chuck Norris CLI.
 
 Small dataclasses that map to API responses. Keep them lightweight so
-they are easy to construct from the API JSON and simple to test.
+they are easy to construct from the API JSON and simple to test. They
+use __slots__ and are frozen, so large search results stay compact.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, List, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Joke:
     id: str
     value: str
     url: Optional[str] = None
     icon_url: Optional[str] = None
-    categories: List[str] = None
+    categories: List[str] = field(default_factory=list)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Joke":
-        return cls(
-            id=data.get("id", ""),
-            value=data.get("value", ""),
-            url=data.get("url"),
-            icon_url=data.get("icon_url"),
-            categories=data.get("categories") or [],
-        )
+        # Bind dict.get once and pass fields positionally; this runs per search hit
+        get = data.get
+        return cls(get("id", ""), get("value", ""), get("url"), get("icon_url"), get("categories") or [])
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchResults:
     total: int
     result: List[Joke]
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "SearchResults":
-        items = []
-        for it in data.get("result", []):
-            items.append(Joke.from_dict(it))
+        from_dict = Joke.from_dict
+        items = [from_dict(it) for it in data.get("result", [])]
         return cls(total=int(data.get("total", len(items))), result=items)
@@ -1,39 +1,177 @@
 import pytest
+import requests
 from unittest.mock import patch, MagicMock
 
 from src import api
 
 
-@patch('src.api.requests.get')
-def test_get_random_joke_success(mock_get):
-	mock_resp = MagicMock()
+@pytest.fixture
+def mock_request(monkeypatch):
+	session = MagicMock()
+	monkeypatch.setattr(api, "_SESSION", session)
+	return session.request
+
+
+def test_get_random_joke_success(mock_request):
+	mock_resp = MagicMock(headers={})
 	mock_resp.raise_for_status.return_value = None
-	mock_resp.json.return_value = {"id": "1", "value": "a joke"}
-	mock_get.return_value = mock_resp
+	mock_resp.content = b'{"id": "1", "value": "a joke"}'
+	mock_request.return_value = mock_resp
 
 	result = api.get_random_joke()
 	assert isinstance(result, dict)
 	assert result["value"] == "a joke"
 
 
-@patch('src.api.requests.get')
-def test_get_random_joke_timeout(mock_get):
+def test_get_random_joke_timeout(mock_request):
 	# Simulate a timeout exception from requests
-	mock_get.side_effect = api.requests.exceptions.Timeout("timeout")
+	mock_request.side_effect = requests.exceptions.Timeout("timeout")
 
 	with pytest.raises(api.APIError) as excinfo:
 		api.get_random_joke()
 	assert "timed out" in str(excinfo.value).lower()
 
 
-@patch('src.api.requests.get')
-def test_get_random_joke_invalid_json(mock_get):
-	mock_resp = MagicMock()
+def test_get_random_joke_invalid_json(mock_request):
+	mock_resp = MagicMock(headers={})
 	mock_resp.raise_for_status.return_value = None
-	# json() raises a ValueError when invalid
-	mock_resp.json.side_effect = ValueError("invalid json")
-	mock_get.return_value = mock_resp
+	mock_resp.content = b"<html>not json</html>"
+	mock_request.return_value = mock_resp
 
 	with pytest.raises(api.APIError) as excinfo:
 		api.get_random_joke()
 	assert "invalid json" in str(excinfo.value).lower()
+
+
+def test_session_reuses_pooled_adapter(monkeypatch):
+	monkeypatch.setattr(api, "CACHE_PATH", "")
+	first = api._get_session()
+	assert api._get_session() is first
+	assert first.get_adapter(api.BASE_URL).max_retries.total == 3
+	api.close_session()
+	assert api._get_session() is not first
+	api.close_session()
+
+
+def test_get_categories_is_cached(mock_request):
+	api.clear_cache()
+	mock_resp = MagicMock(headers={})
+	mock_resp.content = b'["dev", "food"]'
+	mock_request.return_value = mock_resp
+
+	assert api.get_categories() == ["dev", "food"]
+	assert api.get_categories() == ["dev", "food"]
+	assert mock_request.call_count == 1
+	api.clear_cache()
+
+
+def test_search_jokes_cache_evicts_oldest(mock_request, monkeypatch):
+	api.clear_cache()
+	monkeypatch.setattr(api, "SEARCH_CACHE_SIZE", 1)
+	mock_resp = MagicMock(headers={})
+	mock_resp.raw.read.side_effect = lambda **kw: b'{"total": 1, "result": [{"value": "x"}]}'
+	mock_request.return_value = mock_resp
+
+	api.search_jokes("a")
+	api.search_jokes("b")
+	api.search_jokes("b")
+	assert mock_request.call_count == 2
+	assert list(api._SEARCH_CACHE) == [("b", 10)]
+	api.clear_cache()
+
+
+@patch('src.api.time.sleep')
+def test_request_retries_once_after_429(mock_sleep, mock_request):
+	throttled = MagicMock(status_code=429, headers={"Retry-After": "3"})
+	throttled.raise_for_status.side_effect = requests.exceptions.HTTPError("429")
+	ok = MagicMock(status_code=200, headers={})
+	mock_request.side_effect = [throttled, ok]
+
+	assert api._request("GET", "https://example.test") is ok
+	mock_sleep.assert_called_once_with(3.0)
+	throttled.close.assert_called_once()
+	ok.close.assert_not_called()
+
+	# a second 429 after the retry is raised, and both responses are closed
+	mock_sleep.reset_mock()
+	throttled.close.reset_mock()
+	again = MagicMock(status_code=429, headers={})
+	again.raise_for_status.side_effect = requests.exceptions.HTTPError("429")
+	mock_request.side_effect = [throttled, again]
+
+	with pytest.raises(requests.exceptions.HTTPError):
+		api._request("GET", "https://example.test", stream=True)
+	throttled.close.assert_called_once()
+	again.close.assert_called_once()
+	mock_sleep.assert_called_once_with(3.0)
+
+
+@patch('src.api.time.sleep')
+def test_check_ratelimit_waits_when_window_exhausted(mock_sleep):
+	resp = MagicMock(headers={"X-RateLimit-Remaining": "1", "X-RateLimit-Limit": "100", "X-RateLimit-Reset": "5"})
+	api._check_ratelimit(resp)
+	mock_sleep.assert_called_once_with(5.0)
+
+	mock_sleep.reset_mock()
+	resp.headers["X-RateLimit-Remaining"] = "50"
+	api._check_ratelimit(resp)
+	mock_sleep.assert_not_called()
+
+
+def test_session_uses_disk_cache_when_available(monkeypatch, tmp_path):
+	requests_cache = pytest.importorskip("requests_cache")
+	monkeypatch.setattr(api, "CACHE_PATH", str(tmp_path / "cache"))
+	session = api._build_session()
+	try:
+		assert isinstance(session, requests_cache.CachedSession)
+		assert session.settings.urls_expire_after["*/jokes/random"] == requests_cache.DO_NOT_CACHE
+	finally:
+		session.close()
+
+
+@pytest.mark.parametrize("body", [b'{"id": "1"}', b'["value"]', b'"value"'])
+def test_get_random_joke_unexpected_shape(mock_request, body):
+	mock_resp = MagicMock(headers={})
+	mock_resp.content = body
+	mock_request.return_value = mock_resp
+
+	with pytest.raises(api.APIError) as excinfo:
+		api.get_random_joke()
+	assert "unexpected response shape" in str(excinfo.value)
+
+
+def test_search_jokes_cache_is_not_mutated_by_callers(mock_request):
+	api.clear_cache()
+	mock_resp = MagicMock(headers={})
+	mock_resp.raw.read.side_effect = lambda **kw: b'{"total": 2, "result": [{"value": "x"}, {"value": "y"}]}'
+	mock_request.return_value = mock_resp
+
+	first = api.search_jokes("a")
+	first["result"].clear()
+	first["total"] = 0
+	second = api.search_jokes("a")
+	assert second == {"total": 2, "result": [{"value": "x"}, {"value": "y"}]}
+	assert mock_request.call_count == 1
+	api.clear_cache()
+
+
+def test_request_closes_response_on_http_error(mock_request):
+	failed = MagicMock(status_code=500, headers={})
+	failed.raise_for_status.side_effect = requests.exceptions.HTTPError("500")
+	mock_request.return_value = failed
+
+	with pytest.raises(requests.exceptions.HTTPError):
+		api._request("GET", "https://example.test", stream=True)
+	failed.close.assert_called_once()
+
+
+def test_session_falls_back_when_cache_unwritable(monkeypatch):
+	requests_cache = pytest.importorskip("requests_cache")
+	monkeypatch.setattr(api, "CACHE_PATH", "/proc/nonexistent/chuck-cli")
+	session = api._build_session()
+	try:
+		assert isinstance(session, requests.Session)
+		assert not isinstance(session, requests_cache.CachedSession)
+		assert session.get_adapter(api.BASE_URL).max_retries.total == 3
+	finally:
+		session.close()
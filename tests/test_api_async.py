@@ -0,0 +1,78 @@
+import asyncio
+from unittest.mock import patch, AsyncMock
+
+from src import api_async, main
+
+
+def test_bulk_random_preserves_category_order():
+	async def fake_get_json(session, url, params=None):
+		await asyncio.sleep(0.01 if params["category"] == "dev" else 0)
+		return {"id": params["category"], "value": f"{params['category']} joke"}
+
+	with patch('src.api_async._get_json', side_effect=fake_get_json):
+		jokes = asyncio.run(api_async.bulk_random(["dev", "food"]))
+	assert [j["value"] for j in jokes] == ["dev joke", "food joke"]
+
+
+@patch('src.api_async.bulk_random', new_callable=AsyncMock)
+@patch('src.api.get_categories')
+def test_main_random_all_categories(mock_cats, mock_bulk, capsys):
+	mock_cats.return_value = ["dev", "food"]
+	mock_bulk.return_value = [{"value": "dev joke"}, {"value": "food joke"}]
+	rc = main.main(["random", "--all-categories"])
+	captured = capsys.readouterr()
+	assert rc == 0
+	assert "[food]\nfood joke" in captured.out
+
+
+def test_bulk_random_caps_concurrency(monkeypatch):
+	monkeypatch.setattr(api_async, "MAX_CONCURRENCY", 2)
+	in_flight = 0
+	peak = 0
+
+	async def fake_get_json(session, url, params=None):
+		nonlocal in_flight, peak
+		in_flight += 1
+		peak = max(peak, in_flight)
+		await asyncio.sleep(0.01)
+		in_flight -= 1
+		return {"value": params["category"]}
+
+	with patch('src.api_async._get_json', side_effect=fake_get_json):
+		jokes = asyncio.run(api_async.bulk_random([str(i) for i in range(6)]))
+	assert [j["value"] for j in jokes] == [str(i) for i in range(6)]
+	assert peak == 2
+
+
+def test_adaptive_limit_aimd():
+	async def run():
+		limit = api_async.AdaptiveLimit(initial=4, maximum=5, alpha=0.5, beta=0.5)
+
+		async def fast():
+			return "ok"
+
+		async def failing():
+			raise api_async.APIError("429 Too Many Requests")
+
+		for _ in range(4):
+			assert await limit.call(fast) == "ok"
+		assert limit.limit == 5  # additive increase, capped at maximum
+
+		try:
+			await limit.call(failing)
+		except api_async.APIError:
+			pass
+		assert limit.limit == 2.5  # multiplicative decrease
+		return limit
+
+	assert asyncio.run(run())._in_flight == 0
+
+
+def test_search_jokes_async_trims_to_limit():
+	async def fake_get_json(session, url, params=None):
+		return {"total": 3, "result": [{"value": "a"}, {"value": "b"}, {"value": "c"}]}
+
+	with patch('src.api_async._get_json', side_effect=fake_get_json):
+		data = asyncio.run(api_async.search_jokes_async(None, "chuck", limit=2))
+	assert data["total"] == 3
+	assert [j["value"] for j in data["result"]] == ["a", "b"]
@@ -36,3 +36,52 @@ def test_main_search_empty_query(capsys):
 	captured = capsys.readouterr()
 	assert rc == 2
 	assert "search query cannot be empty" in captured.err.lower()
+
+def test_dumps_matches_stdlib_fallback(monkeypatch):
+	data = {"value": "Chuck Norris räknade till oändligheten", "categories": ["dev"]}
+	fast = main._dumps(data)
+	monkeypatch.setattr(main, "orjson", None)
+	assert main._dumps(data) == fast
+
+@patch('src.api.search_jokes')
+def test_main_search_verbose_listing(mock_search, capsys):
+	mock_search.return_value = {"total": 2, "result": [
+		{"id": "a1", "value": "first", "categories": ["dev", "food"]},
+		{"id": "b2", "value": "second", "categories": []},
+	]}
+	rc = main.main(["--verbose", "search", "chuck"])
+	captured = capsys.readouterr()
+	assert rc == 0
+	assert captured.out == (
+		"1. first\n   id: a1\n   categories: dev, food\n"
+		"2. second\n   id: b2\n"
+	)
+
+def test_parser_is_built_once():
+	assert main._get_parser() is main._get_parser()
+
+@patch('src.api.get_categories')
+def test_main_categories_plain_and_json(mock_cats, capsys):
+	mock_cats.return_value = ["dev", "food"]
+	assert main.main(["categories"]) == 0
+	assert capsys.readouterr().out == "dev\nfood\n"
+
+	assert main.main(["--json", "categories"]) == 0
+	assert capsys.readouterr().out == '[\n  "dev",\n  "food"\n]\n'
+
+@patch('src.api.search_jokes')
+def test_main_search_json_output(mock_search, capsys):
+	data = {"total": 1, "result": [{"id": "a1", "value": "Chuck Norris counted to infinity – twice"}]}
+	mock_search.return_value = data
+	rc = main.main(["--json", "search", "chuck"])
+	captured = capsys.readouterr()
+	assert rc == 0
+	assert captured.out == main._dumps(data) + "\n"
+
+@patch('src.api.search_jokes')
+def test_main_search_tolerates_incomplete_items(mock_search, capsys):
+	mock_search.return_value = {"total": 1, "result": [{"categories": []}]}
+	rc = main.main(["--verbose", "search", "chuck"])
+	captured = capsys.readouterr()
+	assert rc == 0
+	assert captured.out == "1. None\n   id: None\n"
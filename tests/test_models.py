@@ -0,0 +1,21 @@
+import dataclasses
+
+import pytest
+
+from src.models import Joke, SearchResults
+
+
+def test_joke_defaults_and_slots():
+	joke = Joke(id="1", value="a joke")
+	assert joke.categories == []
+	assert not hasattr(joke, "__dict__")
+	with pytest.raises(dataclasses.FrozenInstanceError):
+		joke.value = "changed"
+
+
+def test_search_results_from_dict():
+	data = {"total": 2, "result": [{"id": "1", "value": "a"}, {"id": "2", "value": "b", "categories": ["dev"]}]}
+	results = SearchResults.from_dict(data)
+	assert results.total == 2
+	assert [j.value for j in results.result] == ["a", "b"]
+	assert results.result[1].categories == ["dev"]